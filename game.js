@@ -2025,12 +2025,15 @@ function updateGripMeter(grip) {
 }
 
 // Gym Environment Interface
+// Results are positional so Python can unpack them without key lookups:
+// observations are [numeric, grid] and step results are
+// [numeric, grid, reward, done, info].
 window.resetGame = function () {
     resetPlayerState();
     return getObservation();
 };
 
-window.step = function (action) {
+function stepGame(action) {
     // Parse action: [limb_selector, target_dx, target_dy, grab_trigger, piton_trigger, move_x]
     const limbIndex = Math.floor((action[0] + 1) * 2); // -1..1 -> 0..4
     const limbs = ['leftArm', 'rightArm', 'leftLeg', 'rightLeg'];
@@ -2064,18 +2067,80 @@ window.step = function (action) {
 
     // Update game physics
     update();
-    render();
 
     // Calculate reward
-    const height = Math.max(0, Math.floor((CONFIG.groundY - player.y - CONFIG.upperLegLength - CONFIG.lowerLegLength - CONFIG.torsoLength / 2) / 50));
+    const height = getHeight();
     const reward = height - gameState.maxHeight;
 
-    return {
-        observation: getObservation(),
-        reward: reward,
-        done: gameState.gameOver,
-        info: { height: height }
-    };
+    return [...getObservation(), reward, gameState.gameOver, { height: height }];
+}
+
+function getHeight() {
+    return Math.max(0, Math.floor((CONFIG.groundY - player.y - CONFIG.upperLegLength - CONFIG.lowerLegLength - CONFIG.torsoLength / 2) / 50));
+}
+
+window.step = function (action) {
+    const result = stepGame(action);
+    render();
+    return result;
+};
+
+// Runs several steps in one call so the agent pays a single WebDriver
+// round-trip per batch (frame-skip / action-repeat); the canvas is redrawn
+// once, after the last step
+window.step_n = function (actions) {
+    const results = [];
+    for (const action of actions) {
+        results.push(stepGame(action));
+    }
+    render();
+    return results;
+};
+
+// Multi-instance interface: several independent games share this page (and
+// its wall). Each game owns its own player/gameState, which are swapped into
+// the globals while that game is being reset or stepped.
+window.games = [];
+
+function useGame(game) {
+    player = game.player;
+    gameState = game.gameState;
+}
+
+window.reset_all = function (numGames) {
+    const observations = [];
+    window.games = [];
+    for (let i = 0; i < numGames; i++) {
+        player = { x: 0, y: 0, velocityY: 0, limbs: {} };
+        gameState = { bestHeight: 0 };
+        resetPlayerState();
+        window.games.push({ player: player, gameState: gameState, done: false });
+        observations.push(getObservation());
+    }
+    useGame(window.games[0]);
+    render();
+    return observations;
+};
+
+window.step_all = function (actions) {
+    const results = window.games.map((game, i) => {
+        useGame(game);
+        let result;
+        if (game.done) {
+            // Auto-reset a finished game; its action for this step is ignored
+            resetPlayerState();
+            result = [...getObservation(), 0, false, { height: getHeight() }];
+        } else {
+            result = stepGame(actions[i]);
+        }
+        // resetPlayerState() replaces gameState, so always store it back
+        game.gameState = gameState;
+        game.done = result[3];
+        return result;
+    });
+    useGame(window.games[0]);
+    render();
+    return results;
 };
 
 function getObservation() {
@@ -2101,28 +2166,52 @@ function getObservation() {
         player.limbs.rightLeg.grabbedAt ? 1 : (player.limbs.rightLeg.onGround ? 2 : 0)
     ];
 
-    // Grid observation: Local wall grabbability map
+    // Grid observation: Local wall grabbability map (row-major), sent as a
+    // base64 blob (see encodeGrid)
     const gridSize = 50;
-    const grid = [];
+    const grid = new Float32Array(gridSize * gridSize);
     const playerGridX = Math.floor(player.x / canvas.width * gridSize);
     const playerGridY = Math.floor(player.y / canvas.height * gridSize);
 
     for (let gy = 0; gy < gridSize; gy++) {
-        const row = [];
         for (let gx = 0; gx < gridSize; gx++) {
             const worldX = (gx / gridSize) * canvas.width;
             const worldY = (gy / gridSize) * canvas.height;
             const grabbability = getGrabbabilityAt(worldX, worldY);
-            row.push(grabbability);
+            grid[gy * gridSize + gx] = grabbability;
         }
-        grid.push(row);
     }
 
-    return {
-        numeric: numeric,
-        grid: grid
-    };
+    return [numeric, encodeGrid(grid)];
+}
+
+// Wire format of the observation grid, set by the Python side:
+// 'uint8' quantizes grabbability to one byte per cell (1/255 steps),
+// 'float32' sends the exact values as the raw Float32Array bytes,
+// 'bits' sends one bit per cell (LSB first): whether it can be grabbed at all.
+// Either way the blob is far smaller than 2500 JSON numbers and decodes
+// with a single vectorized numpy call in Python.
+window.gridEncoding = 'uint8';
+
+function encodeGrid(grid) {
+    let bytes;
+    if (window.gridEncoding === 'float32') {
+        bytes = new Uint8Array(grid.buffer);
+    } else if (window.gridEncoding === 'bits') {
+        bytes = new Uint8Array(Math.ceil(grid.length / 8));
+        grid.forEach((value, i) => {
+            if (value >= CONFIG.grabThreshold) {
+                bytes[i >> 3] |= 1 << (i & 7);
+            }
+        });
+    } else {
+        bytes = Uint8Array.from(grid, value => Math.round(value * 255));
+    }
+    return btoa(String.fromCharCode(...bytes));
 }
 
 // Init Game
 init();
+
+// Lets the Gym wrapper poll for readiness instead of sleeping after load
+window.gameReady = true;
@@ -1,17 +1,110 @@
 import gymnasium as gym
 from gymnasium import spaces
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gymnasium.vector.utils import batch_space
 import numpy as np
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-import time
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+import websocket
 import json
 import os
+import base64
+import multiprocessing
+from multiprocessing import shared_memory
+import urllib.request
+import weakref
 
-class ClimbingGameEnv(gym.Env):
-    metadata = {'render_modes': ['human']}
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-    def __init__(self, headless=True, game_path=None):
-        super(ClimbingGameEnv, self).__init__()
+
+def _dumps(obj):
+    # orjson returns bytes and serializes numpy arrays natively, so the action
+    # never has to round-trip through Python floats on the hot path.
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, default=lambda o: o.tolist())
+
+
+# chromedriver and Chrome binaries resolved by Selenium Manager on the first
+# launch in this process; later environments reuse them and skip the lookup
+_chrome_paths = None
+
+# Page-side trampoline for _call: the source never changes, so V8 compiles it
+# once and only the arguments vary from step to step
+_CALL_FUNCTION = "function (name, ...args) { return this[name](...args); }"
+
+
+def _loads(s):
+    return orjson.loads(s) if orjson is not None else json.loads(s)
+
+
+def _decode_grid_uint8(raw, grid):
+    # One byte per cell, grabbability quantized to 1/255 steps
+    np.copyto(grid, np.frombuffer(raw, dtype=np.uint8).reshape((50, 50)))
+    grid /= 255.0
+
+
+def _decode_grid_float32(raw, grid):
+    # Exact grabbability as little-endian float32 (the page's Float32Array)
+    np.copyto(grid, np.frombuffer(raw, dtype='<f4').reshape((50, 50)))
+
+
+def _decode_grid_bits(raw, grid):
+    # One bit per cell, LSB first: 1 where grabbability reaches the game's
+    # grab threshold, 0 elsewhere
+    bits = np.unpackbits(np.frombuffer(raw, dtype=np.uint8), count=50 * 50, bitorder='little')
+    np.copyto(grid, bits.reshape((50, 50)))
+
+
+# Wire formats of the base64 grid blob, keyed by grid_encoding
+_GRID_DECODERS = {
+    'uint8': _decode_grid_uint8,
+    'float32': _decode_grid_float32,
+    'bits': _decode_grid_bits,
+}
+
+
+def _decode_obs(obs, numeric, grid, grid_encoding):
+    # Writes one page observation into the given (17,) float32 numeric and
+    # (50, 50) float32/float16 grid arrays. obs is the page's positional
+    # [numeric list, base64 grid, ...] array, so full step results work too.
+    # Slice assignment converts the list straight into the buffer, with no
+    # temporary array in between.
+    numeric[:] = obs[0]
+    _GRID_DECODERS[grid_encoding](base64.b64decode(obs[1]), grid)
+
+
+def _stack_obs(observations, numeric, grid, grid_encoding):
+    # Decodes a list of page observations into row i of the stacked buffers,
+    # which are handed out read-only (see ClimbingGameEnv._process_obs)
+    numeric.flags.writeable = True
+    grid.flags.writeable = True
+    for i, obs in enumerate(observations):
+        _decode_obs(obs, numeric[i], grid[i], grid_encoding)
+    numeric.flags.writeable = False
+    grid.flags.writeable = False
+    return {
+        "numeric": numeric,
+        "grid": grid
+    }
+
+
+class _GamePage:
+    # Chrome + DevTools plumbing shared by the environments that drive a
+    # game page: launching the browser, loading and configuring the page,
+    # and calling its window functions over CDP. Subclasses call _init_page()
+    # from __init__ and build their gym interface on top of _call*().
+
+    def _init_page(self, headless, game_path, grid_encoding, grid_dtype):
+        if grid_encoding not in _GRID_DECODERS:
+            raise ValueError(f"Unknown grid_encoding {grid_encoding!r}, expected one of {sorted(_GRID_DECODERS)}")
+        if np.dtype(grid_dtype) not in (np.float16, np.float32):
+            raise ValueError(f"grid_dtype must be float16 or float32, got {grid_dtype!r}")
 
         if game_path is None:
             # Default to looking in the current directory or a standard location
@@ -19,6 +112,24 @@ class ClimbingGameEnv(gym.Env):
         
         self.game_path = game_path
         self.headless = headless
+        # 'uint8' sends the grid quantized to 1/255 steps (2.5 KB per step),
+        # 'float32' sends the exact grabbability values (10 KB per step),
+        # 'bits' reduces the grid to a 0/1 grabbable mask (313 bytes per step)
+        self.grid_encoding = grid_encoding
+        # float16 halves the grid buffer and the policy input bandwidth; the
+        # grabbability values do not need more precision than that
+        self.grid_dtype = np.dtype(grid_dtype)
+
+        self.driver = None
+        self._devtools = None
+        self._devtools_id = 0
+        self._devtools_replies = {}
+        self._window_id = None
+        self._pending_step = None
+        self._launch_browser()
+
+    def _game_spaces(self):
+        # Action and observation spaces of a single game
 
         # Action Space:
         # 0: Limb Selector (0: leftArm, 1: rightArm, 2: leftLeg, 3: rightLeg) - Mapped from continuous -1..1
@@ -27,83 +138,492 @@ class ClimbingGameEnv(gym.Env):
         # 3: Grab Trigger (> 0.5 to grab/release)
         # 4: Piton Trigger (> 0.5 to place)
         # 5: Move X (-1..1) -> Ground movement
-        self.action_space = spaces.Box(low=-1.0, high=1.0, shape=(6,), dtype=np.float32)
+        action_space = spaces.Box(low=-1.0, high=1.0, shape=(6,), dtype=np.float32)
 
         # Observation Space
         # Numeric: Player State + Limb States
         # Grid: 50x50 local wall map
-        self.observation_space = spaces.Dict({
+        observation_space = spaces.Dict({
             "numeric": spaces.Box(low=-np.inf, high=np.inf, shape=(17,), dtype=np.float32), 
             # Player: relX, worldX, worldY, vy, stamina (5)
             # Limbs (4 * 3): x, y, state (12)
             # Total: 17
-            "grid": spaces.Box(low=0, high=1, shape=(50, 50), dtype=np.float32)
+            "grid": spaces.Box(low=0, high=1, shape=(50, 50), dtype=self.grid_dtype)
         })
-
-        self.driver = None
-        self._launch_browser()
+        return action_space, observation_space
 
     def _launch_browser(self):
+        global _chrome_paths
+
         chrome_options = Options()
         if self.headless:
             chrome_options.add_argument("--headless") 
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
-        
+        # Nothing is displayed or fetched in the background during training
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+
         # You might need to adjust the path to your chromedriver if it's not in PATH
-        self.driver = webdriver.Chrome(options=chrome_options)
+        if _chrome_paths is None:
+            service = Service()
+        else:
+            service = Service(executable_path=_chrome_paths[0])
+            if _chrome_paths[1]:
+                chrome_options.binary_location = _chrome_paths[1]
+        self.driver = webdriver.Chrome(service=service, options=chrome_options, keep_alive=True)
+        _chrome_paths = (self.driver.service.path, chrome_options.binary_location)
+        self._load_page()
+        self._connect_devtools()
+        self._configure_page()
+
+    def _load_page(self):
+        # Returns as soon as game.js has finished its bootstrap
         self.driver.get(self.game_path)
-        
-        # Wait for game to load
-        time.sleep(1)
+        WebDriverWait(self.driver, 5, poll_frequency=0.02).until(
+            lambda driver: driver.execute_script("return window.gameReady === true;")
+        )
 
-    def reset(self, seed=None, options=None):
+    def _connect_devtools(self):
+        # Selenium only launches Chrome; per-step calls go over a persistent
+        # DevTools Protocol websocket to the page instead of one chromedriver
+        # HTTP request per command.
+        address = self.driver.capabilities['goog:chromeOptions']['debuggerAddress']
+        with urllib.request.urlopen(f"http://{address}/json") as response:
+            targets = _loads(response.read())
+        page = next(target for target in targets if target['type'] == 'page')
+        # The timeout bounds every recv(), so a hung or crashed page raises
+        # WebSocketTimeoutException in _receive instead of blocking forever
+        self._devtools = websocket.create_connection(
+            page['webSocketDebuggerUrl'], suppress_origin=True, timeout=30
+        )
+        self._devtools_replies = {}
+        self._window_id = None
+        self._pending_step = None
+
+    def _dispatch(self, method, params):
+        # Sends one CDP command without waiting for the reply; returns the
+        # command id to pass to _receive
+        self._devtools_id += 1
+        self._devtools.send(_dumps({
+            "id": self._devtools_id,
+            "method": method,
+            "params": params
+        }))
+        return self._devtools_id
+
+    def _receive(self, command_id):
+        # Blocks until the reply to command_id arrives and returns its result.
+        # The whole reply, page values included, is decoded in one _loads
+        # call. Replies to other in-flight commands are kept for their own
+        # _receive; events (no id) are dropped.
+        while command_id not in self._devtools_replies:
+            message = _loads(self._devtools.recv())
+            if 'id' in message:
+                self._devtools_replies[message['id']] = message
+        message = self._devtools_replies.pop(command_id)
+
+        if 'error' in message:
+            raise RuntimeError(message['error']['message'])
+        result = message['result']
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            raise RuntimeError(details.get('exception', {}).get('description', details['text']))
+        return result
+
+    def _send(self, method, params):
+        return self._receive(self._dispatch(method, params))
+
+    def _eval(self, expression):
+        # Evaluates expression in the page and returns its value
+        result = self._send("Runtime.evaluate", {"expression": expression, "returnByValue": True})
+        return result['result'].get('value')
+
+    def _call_async(self, name, *args):
+        # Starts window[name](*args) in the page and returns a handle for
+        # _call_wait. Arguments travel as CDP values (numpy arrays included)
+        # instead of being spliced into a fresh script that the page would
+        # have to parse on every step.
+        if self._window_id is None:
+            self._window_id = self._send("Runtime.evaluate", {"expression": "window"})['result']['objectId']
+        return self._dispatch("Runtime.callFunctionOn", {
+            "objectId": self._window_id,
+            "functionDeclaration": _CALL_FUNCTION,
+            "arguments": [{"value": name}] + [{"value": arg} for arg in args],
+            "returnByValue": True
+        })
+
+    def _call_wait(self, command_id):
+        return self._receive(command_id)['result'].get('value')
+
+    def _call(self, name, *args):
+        # Calls window[name](*args) and returns its value
+        return self._call_wait(self._call_async(name, *args))
+
+    def _configure_page(self):
+        # Page settings live in JS globals, so this has to be redone after
+        # every (re)load of the page
+        self._window_id = None
+        self._eval(f"window.gridEncoding = {_dumps(self.grid_encoding)}")
+
+    def _discard_pending_step(self):
+        # A step started with step_async() but never collected is finished
+        # and thrown away, so its reply cannot be mistaken for a later one
+        if self._pending_step is not None:
+            command_id, self._pending_step = self._pending_step, None
+            try:
+                self._receive(command_id)
+            except RuntimeError:
+                # The abandoned step's own error no longer matters
+                pass
+
+    def _reset_page(self, name, *args):
+        # Calls the page reset function window[name](*args), relaunching
+        # Chrome after close() and reloading the page once if the call fails
         if self.driver is None:
             self._launch_browser()
-            
+
         try:
-            obs_json = self.driver.execute_script("return window.resetGame();")
-            obs = self._process_obs(obs_json)
-            info = {}
-            return obs, info
+            self._discard_pending_step()
+            return self._call(name, *args)
         except Exception as e:
             print(f"Error during reset: {e}")
-            self.driver.get(self.game_path)
-            time.sleep(1)
-            obs_json = self.driver.execute_script("return window.resetGame();")
-            obs = self._process_obs(obs_json)
-            info = {}
-            return obs, info
+            self._load_page()
+            self._configure_page()
+            return self._call(name, *args)
+
+    def _close_page(self):
+        if self._devtools:
+            self._devtools.close()
+            self._devtools = None
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+
+
+class ClimbingGameEnv(_GamePage, gym.Env):
+    metadata = {'render_modes': ['human']}
+
+    def __init__(self, headless=True, game_path=None, grid_encoding='uint8', grid_dtype=np.float32):
+        super(ClimbingGameEnv, self).__init__()
+        self._init_page(headless, game_path, grid_encoding, grid_dtype)
+        self.action_space, self.observation_space = self._game_spaces()
+
+        # Observations are decoded into these buffers in place (see _process_obs)
+        self._numeric_buf = np.empty(17, dtype=np.float32)
+        self._grid_buf = np.empty((50, 50), dtype=self.grid_dtype)
+
+    def reset(self, seed=None, options=None):
+        obs = self._process_obs(self._reset_page("resetGame"))
+        info = {}
+        return obs, info
 
     def step(self, action):
-        action_list = action.tolist()
-        
-        result = self.driver.execute_script(f"return window.step({json.dumps(action_list)});")
+        self.step_async(action)
+        return self.step_wait()
+
+    def step_async(self, action):
+        # Starts a step in the page and returns without waiting for it, so
+        # the caller can overlap its own work (e.g. the policy forward pass)
+        # with the game update; step_wait() then collects the result. A
+        # policy that picks the next action while this step is in flight
+        # only sees the previous observation, so its actions are one step
+        # stale: that trade-off is up to the caller.
+        if self._pending_step is not None:
+            raise RuntimeError("step_async() called again before step_wait()")
+        self._pending_step = self._call_async("step", np.ascontiguousarray(action, dtype=np.float32))
+
+    def step_wait(self):
+        if self._pending_step is None:
+            raise RuntimeError("step_wait() called without a pending step_async()")
+        # Cleared before waiting: if the page throws, the reply is consumed
+        # and the env must not keep waiting for it
+        command_id, self._pending_step = self._pending_step, None
+        result = self._call_wait(command_id)
         
-        obs = self._process_obs(result['observation'])
-        reward = result['reward']
-        terminated = result['done']
+        obs = self._process_obs(result)
+        _, _, reward, terminated, info = result
         truncated = False
-        info = result.get('info', {})
         
         return obs, reward, terminated, truncated, info
 
-    def _process_obs(self, obs_dict):
-        # Convert lists back to numpy arrays
-        numeric = np.array(obs_dict['numeric'], dtype=np.float32)
-        grid = np.array(obs_dict['grid'], dtype=np.float32).reshape((50, 50))
+    def step_batch(self, actions):
+        # Runs len(actions) consecutive steps in a single browser round-trip.
+        # Results are stacked along a new leading axis of size K.
+        actions = np.ascontiguousarray(actions, dtype=np.float32)
+        if actions.ndim != 2 or actions.shape[1] != 6:
+            # A single (6,) action would otherwise run as six scalar steps
+            raise ValueError(f"Expected actions shaped (K, 6), got {actions.shape}")
+        results = self._call("step_n", actions)
+
+        k = len(results)
+        obs = _stack_obs(
+            results,
+            np.empty((k, 17), dtype=np.float32),
+            np.empty((k, 50, 50), dtype=self.grid_dtype),
+            self.grid_encoding
+        )
+        reward = np.array([result[2] for result in results], dtype=np.float64)
+        terminated = np.array([result[3] for result in results], dtype=bool)
+        truncated = np.zeros(k, dtype=bool)
+        info = [result[4] for result in results]
+
+        return obs, reward, terminated, truncated, info
+
+    def _process_obs(self, obs):
+        # Decoded into preallocated buffers, so the returned arrays are
+        # overwritten by the next step()/reset(): copy them to keep history.
+        # They are read-only outside of this method, so a consumer that
+        # mutates an observation fails loudly instead of corrupting the next.
+        self._numeric_buf.flags.writeable = True
+        self._grid_buf.flags.writeable = True
+        _decode_obs(obs, self._numeric_buf, self._grid_buf, self.grid_encoding)
+        self._numeric_buf.flags.writeable = False
+        self._grid_buf.flags.writeable = False
         return {
-            "numeric": numeric,
-            "grid": grid
+            "numeric": self._numeric_buf,
+            "grid": self._grid_buf
         }
 
     def render(self):
         pass
 
     def close(self):
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
+        self._close_page()
+
+
+class VectorClimbingGameEnv(_GamePage, VectorEnv):
+    # Hosts num_envs independent games in a single Chrome page and steps them
+    # in lockstep, so a vector step costs one browser round-trip instead of
+    # one per environment. Observations, rewards and flags are stacked along
+    # a leading num_envs axis. A game that terminated is reset by the next
+    # step(), which ignores its action and returns the fresh observation.
+    metadata = {'autoreset_mode': AutoresetMode.NEXT_STEP}
+
+    def __init__(self, num_envs=8, headless=True, game_path=None, grid_encoding='uint8', grid_dtype=np.float32):
+        self.num_envs = num_envs
+        self._init_page(headless, game_path, grid_encoding, grid_dtype)
+
+        self.single_action_space, self.single_observation_space = self._game_spaces()
+        self.action_space = batch_space(self.single_action_space, num_envs)
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+
+        self._numeric_buf = np.empty((num_envs, 17), dtype=np.float32)
+        self._grid_buf = np.empty((num_envs, 50, 50), dtype=self.grid_dtype)
+
+    def reset(self, *, seed=None, options=None):
+        super(VectorClimbingGameEnv, self).reset(seed=seed, options=options)
+        observations = self._reset_page("reset_all", self.num_envs)
+        self.closed = False
+        obs = _stack_obs(observations, self._numeric_buf, self._grid_buf, self.grid_encoding)
+        return obs, {}
+
+    def step(self, actions):
+        self.step_async(actions)
+        return self.step_wait()
+
+    def step_async(self, actions):
+        # See ClimbingGameEnv.step_async
+        if self._pending_step is not None:
+            raise RuntimeError("step_async() called again before step_wait()")
+        self._pending_step = self._call_async("step_all", np.ascontiguousarray(actions, dtype=np.float32))
+
+    def step_wait(self):
+        if self._pending_step is None:
+            raise RuntimeError("step_wait() called without a pending step_async()")
+        command_id, self._pending_step = self._pending_step, None
+        results = self._call_wait(command_id)
+
+        obs = _stack_obs(results, self._numeric_buf, self._grid_buf, self.grid_encoding)
+        reward = np.array([result[2] for result in results], dtype=np.float64)
+        terminated = np.array([result[3] for result in results], dtype=bool)
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        info = {"height": np.array([result[4]['height'] for result in results])}
+
+        return obs, reward, terminated, truncated, info
+
+    def close_extras(self, **kwargs):
+        self._close_page()
+
+
+def _shared_obs_arrays(shm, num_envs, grid_dtype):
+    # Two observation slots: (2, num_envs, 17) numeric rows followed by
+    # (2, num_envs, 50, 50) grids. Workers write into one slot while the
+    # caller still holds the observation in the other. Both are views of one
+    # byte array, which every observation handed out keeps alive.
+    numeric_size = 2 * num_envs * 17 * 4
+    grid_size = 2 * num_envs * 50 * 50 * grid_dtype.itemsize
+    block = np.ndarray(numeric_size + grid_size, dtype=np.uint8, buffer=shm.buf)
+    numeric = block[:numeric_size].view(np.float32).reshape((2, num_envs, 17))
+    grid = block[numeric_size:].view(grid_dtype).reshape((2, num_envs, 50, 50))
+    return numeric, grid
+
+
+def _parallel_worker(remote, shm_name, num_envs, index, env_kwargs):
+    shm = shared_memory.SharedMemory(name=shm_name, track=False)
+    numeric, grid = _shared_obs_arrays(shm, num_envs, env_kwargs['grid_dtype'])
+    env = ClimbingGameEnv(**env_kwargs)
+
+    done = False
+    try:
+        while True:
+            cmd, data = remote.recv()
+            if cmd in ('step', 'reset'):
+                # Decode straight into this worker's row of the slot named
+                # by the parent
+                slot = data[0]
+                env._numeric_buf = numeric[slot, index]
+                env._grid_buf = grid[slot, index]
+            if cmd == 'step':
+                if done:
+                    # Auto-reset a finished game; its action for this step is ignored
+                    env.reset()
+                    result = (0.0, False, False, {'height': 0})
+                else:
+                    _, reward, terminated, truncated, info = env.step(data[1])
+                    result = (reward, terminated, truncated, info)
+                done = result[1] or result[2]
+                remote.send(result)
+            elif cmd == 'reset':
+                env.reset()
+                done = False
+                remote.send(None)
+            elif cmd == 'get_spaces':
+                remote.send((env.action_space, env.observation_space))
+            elif cmd == 'close':
+                break
+    finally:
+        env.close()
+        # Drop every view of the shared block before detaching from it
+        del env, numeric, grid
+        shm.close()
+
+
+class ParallelClimbingGameEnv(VectorEnv):
+    # Runs num_envs ClimbingGameEnv instances in worker processes, each with
+    # its own Chrome, and steps them concurrently. Workers decode observations
+    # straight into shared memory, so only rewards and flags are pickled.
+    # Stacking and auto-reset behave like VectorClimbingGameEnv. The block
+    # is double-buffered: each step or reset writes the slot the caller is
+    # not holding, so the last returned observation stays intact while a
+    # step_async() is in flight, until the next step_wait()/reset().
+    metadata = {'autoreset_mode': AutoresetMode.NEXT_STEP}
+
+    def __init__(self, num_envs=4, headless=True, game_path=None, grid_encoding='uint8', grid_dtype=np.float32):
+        self.num_envs = num_envs
+        grid_dtype = np.dtype(grid_dtype)
+        env_kwargs = {
+            "headless": headless,
+            "game_path": game_path,
+            "grid_encoding": grid_encoding,
+            "grid_dtype": grid_dtype
+        }
+
+        self._shm = shared_memory.SharedMemory(create=True, size=2 * num_envs * (17 * 4 + 50 * 50 * grid_dtype.itemsize))
+        self._numeric_buf, self._grid_buf = _shared_obs_arrays(self._shm, num_envs, grid_dtype)
+        # Observations returned to the caller are views of the block, so it
+        # is unmapped only once the last of them is gone (see close_extras)
+        weakref.finalize(self._numeric_buf.base, self._shm.close)
+        # Only the workers write to the shared block
+        self._numeric_buf.flags.writeable = False
+        self._grid_buf.flags.writeable = False
+        # Slot the workers write next; the other one is the caller's
+        self._slot = 0
+        self._pending_step = False
+
+        self._remotes = []
+        self._processes = []
+        for index in range(num_envs):
+            remote, work_remote = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_parallel_worker,
+                args=(work_remote, self._shm.name, num_envs, index, env_kwargs),
+                daemon=True
+            )
+            process.start()
+            work_remote.close()
+            self._remotes.append(remote)
+            self._processes.append(process)
+
+        self._remotes[0].send(('get_spaces', None))
+        self.single_action_space, self.single_observation_space = self._remotes[0].recv()
+        self.action_space = batch_space(self.single_action_space, num_envs)
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+
+    def reset(self, *, seed=None, options=None):
+        super(ParallelClimbingGameEnv, self).reset(seed=seed, options=options)
+        if self._pending_step:
+            # Collect and drop a step_async() that was never waited on, so
+            # its replies cannot be mistaken for the reset acknowledgements
+            self.step_wait()
+
+        slot = self._next_slot()
+        for remote in self._remotes:
+            remote.send(('reset', (slot,)))
+        for remote in self._remotes:
+            remote.recv()
+
+        return self._slot_obs(slot), {}
+
+    def step(self, actions):
+        self.step_async(actions)
+        return self.step_wait()
+
+    def step_async(self, actions):
+        # See ClimbingGameEnv.step_async
+        if self._pending_step:
+            raise RuntimeError("step_async() called again before step_wait()")
+        if len(actions) != self.num_envs:
+            # A worker sent no action would leave step_wait() blocked on it
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}")
+        slot = self._next_slot()
+        for remote, action in zip(self._remotes, actions):
+            remote.send(('step', (slot, action)))
+        self._pending_step = True
+
+    def step_wait(self):
+        if not self._pending_step:
+            raise RuntimeError("step_wait() called without a pending step_async()")
+        # Cleared first, so a dead worker (EOFError) does not leave the step
+        # pending forever
+        self._pending_step = False
+        results = [remote.recv() for remote in self._remotes]
+
+        obs = self._slot_obs(1 - self._slot)
+        reward = np.array([result[0] for result in results], dtype=np.float64)
+        terminated = np.array([result[1] for result in results], dtype=bool)
+        truncated = np.array([result[2] for result in results], dtype=bool)
+        info = {"height": np.array([result[3]['height'] for result in results])}
+
+        return obs, reward, terminated, truncated, info
+
+    def _next_slot(self):
+        # Hands the slot the caller is not holding to the workers
+        slot = self._slot
+        self._slot = 1 - slot
+        return slot
+
+    def _slot_obs(self, slot):
+        return {
+            "numeric": self._numeric_buf[slot],
+            "grid": self._grid_buf[slot]
+        }
+
+    def close_extras(self, **kwargs):
+        if self._shm is None:
+            return
+        for remote in self._remotes:
+            remote.send(('close', None))
+        for process in self._processes:
+            process.join()
+        # Unlinking frees the name right away; the mapping is closed by the
+        # finalizer once the caller drops its last observation
+        self._shm.unlink()
+        del self._numeric_buf, self._grid_buf
+        self._shm = None
 
 if __name__ == "__main__":
     # Test run
@@ -1,14 +1,21 @@
 import unittest
 import numpy as np
-from gym_env import ClimbingGameEnv
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gym_env import ClimbingGameEnv, VectorClimbingGameEnv, ParallelClimbingGameEnv
 
 class TestClimbingGameEnv(unittest.TestCase):
-    def setUp(self):
+    # One browser is shared by all tests in the class; each test resets it
+    @classmethod
+    def setUpClass(cls):
         # Use headless mode for testing
-        self.env = ClimbingGameEnv(headless=True)
+        cls.env = ClimbingGameEnv(headless=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.env.close()
 
-    def tearDown(self):
-        self.env.close()
+    def setUp(self):
+        self.env.reset()
 
     def test_observation_space(self):
         obs, info = self.env.reset()
@@ -22,6 +29,10 @@ class TestClimbingGameEnv(unittest.TestCase):
         self.assertTrue(isinstance(obs['numeric'], np.ndarray))
         self.assertTrue(isinstance(obs['grid'], np.ndarray))
 
+        # Observations are shared buffers handed out read-only
+        self.assertFalse(obs['numeric'].flags.writeable)
+        self.assertFalse(obs['grid'].flags.writeable)
+
     def test_action_space(self):
         action = self.env.action_space.sample()
         self.assertEqual(action.shape, (6,))
@@ -41,6 +52,72 @@ class TestClimbingGameEnv(unittest.TestCase):
         
         self.assertEqual(obs['numeric'].shape, (17,))
 
+    def test_step_async(self):
+        action = np.zeros(6, dtype=np.float32)
+        self.env.step_async(action)
+        with self.assertRaises(RuntimeError):
+            self.env.step_async(action)
+
+        obs, reward, terminated, truncated, info = self.env.step_wait()
+        self.assertEqual(obs['numeric'].shape, (17,))
+        self.assertIsInstance(terminated, bool)
+
+        # reset() discards a step that was never collected
+        self.env.step_async(action)
+        obs, info = self.env.reset()
+        self.assertEqual(obs['grid'].shape, (50, 50))
+
+    def test_step_batch(self):
+        self.env.reset()
+        actions = np.zeros((4, 6), dtype=np.float32)
+        obs, reward, terminated, truncated, info = self.env.step_batch(actions)
+
+        self.assertEqual(obs['numeric'].shape, (4, 17))
+        self.assertEqual(obs['grid'].shape, (4, 50, 50))
+        self.assertEqual(reward.shape, (4,))
+        self.assertEqual(terminated.shape, (4,))
+        self.assertEqual(truncated.shape, (4,))
+        self.assertEqual(len(info), 4)
+
+        with self.assertRaises(ValueError):
+            self.env.step_batch(np.zeros(6, dtype=np.float32))
+
+    def _observe_grid(self, grid_encoding):
+        # Re-reads the current observation from the shared page under another
+        # grid encoding. Every page load seeds the wall noise at random, so
+        # encodings can only be compared on the same page.
+        self.env.grid_encoding = grid_encoding
+        self.env._configure_page()
+        try:
+            return self.env._process_obs(self.env._call("getObservation"))['grid'].copy()
+        finally:
+            self.env.grid_encoding = 'uint8'
+            self.env._configure_page()
+
+    def test_grid_encoding(self):
+        obs, info = self.env.reset()
+        quantized = obs['grid'].copy()
+
+        exact = self._observe_grid('float32')
+        self.assertEqual(exact.dtype, np.float32)
+        np.testing.assert_allclose(exact, quantized, atol=1 / 255)
+
+        # The bit mask marks cells at or above the game's grab threshold
+        threshold = self.env._eval("CONFIG.grabThreshold")
+        np.testing.assert_array_equal(self._observe_grid('bits'), exact >= threshold)
+
+        with self.assertRaises(ValueError):
+            ClimbingGameEnv(headless=True, grid_encoding='png')
+
+    def test_grid_dtype(self):
+        env = ClimbingGameEnv(headless=True, grid_dtype=np.float16)
+        try:
+            obs, info = env.reset()
+            self.assertEqual(obs['grid'].dtype, np.float16)
+            self.assertTrue(env.observation_space.contains(obs))
+        finally:
+            env.close()
+
     def test_reset(self):
         obs1, info1 = self.env.reset()
         for _ in range(5):
@@ -50,5 +127,134 @@ class TestClimbingGameEnv(unittest.TestCase):
         
         self.assertAlmostEqual(obs1['numeric'][3], 0, delta=0.1)
 
+class TestVectorClimbingGameEnv(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = VectorClimbingGameEnv(num_envs=3, headless=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.env.close()
+
+    def test_step(self):
+        obs, info = self.env.reset()
+        self.assertEqual(obs['numeric'].shape, (3, 17))
+        self.assertEqual(obs['grid'].shape, (3, 50, 50))
+
+        actions = np.zeros((3, 6), dtype=np.float32)
+        actions[0, 5] = 1.0
+        actions[1, 5] = -1.0
+        obs, reward, terminated, truncated, info = self.env.step(actions)
+
+        self.assertEqual(reward.shape, (3,))
+        self.assertEqual(terminated.shape, (3,))
+        self.assertEqual(info['height'].shape, (3,))
+        # Each game moved independently along the ground
+        self.assertGreater(obs['numeric'][0, 1], obs['numeric'][1, 1])
+
+    def test_step_async(self):
+        self.env.reset()
+        actions = np.zeros((3, 6), dtype=np.float32)
+        self.env.step_async(actions)
+        with self.assertRaises(RuntimeError):
+            self.env.step_async(actions)
+
+        obs, reward, terminated, truncated, info = self.env.step_wait()
+        self.assertEqual(obs['numeric'].shape, (3, 17))
+        self.assertEqual(reward.shape, (3,))
+
+        # reset() discards a step that was never collected
+        self.env.step_async(actions)
+        obs, info = self.env.reset()
+        self.assertEqual(obs['grid'].shape, (3, 50, 50))
+
+    def test_failed_step_recovers(self):
+        self.env.reset()
+        # Fewer action rows than games makes the page's step_all throw
+        with self.assertRaises(RuntimeError):
+            self.env.step(np.zeros((1, 6), dtype=np.float32))
+
+        obs, info = self.env.reset()
+        obs, reward, terminated, truncated, info = self.env.step(np.zeros((3, 6), dtype=np.float32))
+        self.assertEqual(reward.shape, (3,))
+
+    def test_spaces(self):
+        self.assertIsInstance(self.env, VectorEnv)
+        self.assertEqual(self.env.metadata['autoreset_mode'], AutoresetMode.NEXT_STEP)
+        self.assertEqual(self.env.single_observation_space['grid'].shape, (50, 50))
+        self.assertEqual(self.env.action_space.shape, (3, 6))
+
+        obs, info = self.env.reset()
+        self.assertTrue(self.env.observation_space.contains(obs))
+
+class TestParallelClimbingGameEnv(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = ParallelClimbingGameEnv(num_envs=2, headless=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.env.close()
+
+    def test_step(self):
+        obs, info = self.env.reset()
+        self.assertEqual(obs['numeric'].shape, (2, 17))
+        self.assertEqual(obs['grid'].shape, (2, 50, 50))
+
+        actions = np.zeros((2, 6), dtype=np.float32)
+        obs, reward, terminated, truncated, info = self.env.step(actions)
+
+        self.assertEqual(reward.shape, (2,))
+        self.assertEqual(terminated.shape, (2,))
+        self.assertEqual(truncated.shape, (2,))
+        self.assertEqual(info['height'].shape, (2,))
+
+    def test_step_async(self):
+        self.env.reset()
+        actions = np.zeros((2, 6), dtype=np.float32)
+        # Walk along the ground so every step changes the observation
+        actions[:, 5] = 1.0
+        previous, reward, terminated, truncated, info = self.env.step(actions)
+        held = previous['numeric'].copy()
+
+        self.env.step_async(actions)
+        with self.assertRaises(RuntimeError):
+            self.env.step_async(actions)
+
+        obs, reward, terminated, truncated, info = self.env.step_wait()
+        self.assertEqual(obs['numeric'].shape, (2, 17))
+        self.assertEqual(reward.shape, (2,))
+        # The step was written to the other shared slot, so the observation
+        # returned before it is untouched
+        np.testing.assert_array_equal(previous['numeric'], held)
+        self.assertFalse(np.shares_memory(previous['numeric'], obs['numeric']))
+        self.assertFalse(np.array_equal(obs['numeric'], held))
+
+        # reset() discards a step that was never collected
+        self.env.step_async(actions)
+        obs, info = self.env.reset()
+        self.assertEqual(obs['grid'].shape, (2, 50, 50))
+
+        with self.assertRaises(ValueError):
+            self.env.step_async(actions[:1])
+        obs, reward, terminated, truncated, info = self.env.step(actions)
+        self.assertEqual(reward.shape, (2,))
+
+    def test_spaces(self):
+        self.assertIsInstance(self.env, VectorEnv)
+        self.assertEqual(self.env.action_space.shape, (2, 6))
+
+        obs, info = self.env.reset()
+        self.assertTrue(self.env.observation_space.contains(obs))
+
+    def test_close_while_holding_obs(self):
+        env = ParallelClimbingGameEnv(num_envs=1, headless=True)
+        obs, info = env.reset()
+        env.close()
+        self.assertTrue(env.closed)
+        # The shared block stays mapped until the caller drops its views
+        self.assertTrue(np.all(np.isfinite(obs['numeric'])))
+
+
 if __name__ == '__main__':
     unittest.main()